@@ -0,0 +1,239 @@
+"""
+Context Compression Module for IT Helpdesk Chatbot
+
+This module post-processes the passages returned by the FAISS retriever
+before they are stuffed into the GPT-4o-mini prompt. Retrieved passages
+are filtered by relevance, near-duplicates are dropped using MMR
+(maximal marginal relevance) over the cached document embeddings, and the
+survivors are packed into a configurable token budget. Every call returns
+how many prompt tokens were saved so the UI can report it per turn.
+
+Author: IT Helpdesk Chatbot System
+Date: October 19, 2026
+"""
+
+import math
+import os
+
+# Tokenizer is loaded on first use, see _get_encoding(). Its BPE file is cached
+# inside the project so the startup artifact build can download it ahead of time
+TIKTOKEN_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tiktoken_cache")
+_ENCODING = None
+_ENCODING_LOADED = False
+
+# Default settings, each can be overridden with an environment variable.
+# fetch_k matches the k=4 of the plain FAISS retriever, so saved tokens are
+# measured against what an uncompressed prompt would have sent. LangChain's
+# FAISS relevance score is 1 - squared_L2 / sqrt(2); for normalised
+# text-embedding-3-small vectors a score of 0.0 is a cosine similarity of
+# about 0.29, below which a passage is unrelated to the question. KB entries
+# are 20-36 tokens each, so a 120 token budget keeps roughly 3-4 passages.
+DEFAULT_SETTINGS = {
+    'fetch_k': 4,                  # passages fetched from FAISS before compression
+    'relevance_threshold': 0.0,    # drop passages scoring below this
+    'duplicate_threshold': 0.92,   # cosine similarity treated as near-duplicate
+    'mmr_lambda': 0.7,             # 1.0 = pure relevance, 0.0 = pure diversity
+    'token_budget': 120,           # max tokens of retrieved context per prompt
+}
+
+_SETTINGS_ENV_VARS = {
+    'fetch_k': ("CONTEXT_FETCH_K", int),
+    'relevance_threshold': ("CONTEXT_RELEVANCE_THRESHOLD", float),
+    'duplicate_threshold': ("CONTEXT_DUPLICATE_THRESHOLD", float),
+    'mmr_lambda': ("CONTEXT_MMR_LAMBDA", float),
+    'token_budget': ("CONTEXT_TOKEN_BUDGET", int),
+}
+
+def load_compression_settings():
+    """
+    Build the compression settings from environment variables
+
+    Returns:
+        dict: Settings with defaults for any missing or invalid variable
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    for name, (env_var, cast) in _SETTINGS_ENV_VARS.items():
+        value = os.getenv(env_var)
+        if value:
+            try:
+                settings[name] = cast(value)
+            except ValueError:
+                pass
+    return settings
+
+def _get_encoding():
+    """Load the tiktoken encoding on first use, None if tiktoken is unavailable"""
+    global _ENCODING, _ENCODING_LOADED
+    if not _ENCODING_LOADED:
+        _ENCODING_LOADED = True
+        os.environ.setdefault("TIKTOKEN_CACHE_DIR", TIKTOKEN_CACHE_DIR)
+        try:
+            import tiktoken
+            _ENCODING = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            # tiktoken is optional - fall back to the ~4 characters per token rule
+            _ENCODING = None
+    return _ENCODING
+
+def estimate_tokens(text):
+    """
+    Estimate the number of prompt tokens used by a piece of text
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        int: Token count (exact with tiktoken, approximate otherwise)
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return max(1, math.ceil(len(text) / 4))
+
+def cosine_similarity(vector_a, vector_b):
+    """
+    Cosine similarity between two embedding vectors
+
+    Args:
+        vector_a (list): First vector
+        vector_b (list): Second vector
+
+    Returns:
+        float: Similarity in [-1, 1], or 0.0 if either vector is empty
+    """
+    dot = sum(a * b for a, b in zip(vector_a, vector_b))
+    norm_a = math.sqrt(sum(a * a for a in vector_a))
+    norm_b = math.sqrt(sum(b * b for b in vector_b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+def compress_context(passages, settings=None):
+    """
+    Filter, deduplicate and pack retrieved passages into a token budget
+
+    The most relevant passage is always kept, even if it falls below the
+    relevance cutoff or on its own exceeds the token budget, so the model
+    never answers without any knowledge base context.
+
+    Args:
+        passages (list): (text, relevance_score, vector) tuples in retrieval
+            order. vector may be None when no embedding is cached, in which
+            case only exact duplicate texts are removed.
+        settings (dict): Compression settings, defaults to DEFAULT_SETTINGS
+
+    Returns:
+        tuple: (list of kept passage texts, stats dict)
+    """
+    settings = {**DEFAULT_SETTINGS, **(settings or {})}
+
+    original_tokens = sum(estimate_tokens(text) for text, _, _ in passages)
+
+    # 1. Relevance cutoff
+    candidates = [
+        passage for passage in passages
+        if passage[1] >= settings['relevance_threshold']
+    ]
+    if not candidates and passages:
+        candidates = [max(passages, key=lambda passage: passage[1])]
+    below_threshold = len(passages) - len(candidates)
+
+    # 2. MMR selection, skipping near-duplicates of already selected passages
+    selected = []
+    duplicates = 0
+    while candidates:
+        best_index, best_score, best_is_duplicate = None, None, False
+        for index, (text, relevance, vector) in enumerate(candidates):
+            max_similarity = 0.0
+            for kept_text, _, kept_vector in selected:
+                if text == kept_text:
+                    similarity = 1.0
+                elif vector is None or kept_vector is None:
+                    similarity = 0.0
+                else:
+                    similarity = cosine_similarity(vector, kept_vector)
+                max_similarity = max(max_similarity, similarity)
+
+            if max_similarity >= settings['duplicate_threshold']:
+                best_index, best_is_duplicate = index, True
+                break
+
+            mmr_score = (settings['mmr_lambda'] * relevance
+                         - (1 - settings['mmr_lambda']) * max_similarity)
+            if best_score is None or mmr_score > best_score:
+                best_index, best_score = index, mmr_score
+
+        passage = candidates.pop(best_index)
+        if best_is_duplicate:
+            duplicates += 1
+        else:
+            selected.append(passage)
+
+    # 3. Pack into the token budget, highest MMR rank first
+    kept = []
+    used_tokens = 0
+    over_budget = 0
+    for text, _, _ in selected:
+        tokens = estimate_tokens(text)
+        if kept and used_tokens + tokens > settings['token_budget']:
+            over_budget += 1
+            continue
+        kept.append(text)
+        used_tokens += tokens
+
+    stats = {
+        'passages_in': len(passages),
+        'passages_out': len(kept),
+        'below_threshold': below_threshold,
+        'duplicates': duplicates,
+        'over_budget': over_budget,
+        'original_tokens': original_tokens,
+        'compressed_tokens': used_tokens,
+        'saved_tokens': original_tokens - used_tokens,
+    }
+    return kept, stats
+
+def build_compressed_retriever(vector_store, text_vectors, settings=None):
+    """
+    Wrap a FAISS vector store in a LangChain retriever that compresses context
+
+    Args:
+        vector_store: LangChain FAISS vector store
+        text_vectors (dict): Mapping of document text to its embedding vector
+        settings (dict): Compression settings, defaults to environment settings
+
+    Returns:
+        BaseRetriever: Retriever that stores the turn's compression stats in
+            each returned Document's metadata under 'compression_stats'
+    """
+    from langchain_core.documents import Document
+    from langchain_core.retrievers import BaseRetriever
+
+    class CompressedRetriever(BaseRetriever):
+        vector_store: object
+        text_vectors: dict
+        settings: dict
+
+        def _get_relevant_documents(self, query, *, run_manager=None):
+            results = self.vector_store.similarity_search_with_relevance_scores(
+                query, k=self.settings['fetch_k']
+            )
+            passages = [
+                (doc.page_content, score, self.text_vectors.get(doc.page_content))
+                for doc, score in results
+            ]
+            # Stats travel with the documents rather than on the retriever,
+            # which is shared by every session in the process
+            kept, stats = compress_context(passages, self.settings)
+            return [
+                Document(page_content=text, metadata={'compression_stats': stats})
+                for text in kept
+            ]
+
+    return CompressedRetriever(
+        vector_store=vector_store,
+        text_vectors=text_vectors,
+        settings=settings or load_compression_settings()
+    )
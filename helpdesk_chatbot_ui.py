@@ -1,19 +1,16 @@
 import streamlit as st
 import sys
 import os
-import pandas as pd
+import threading
+import time
 from datetime import datetime
 
 # Add the current directory to the path to import our chatbot modules
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-# Import the chatbot components
-from langchain_community.vectorstores import FAISS
-from langchain_openai import AzureOpenAIEmbeddings, AzureChatOpenAI
-from langchain.chains import ConversationalRetrievalChain
-from openai import AzureOpenAI
-import httpx
+# Heavy chatbot components (langchain, openai, pandas, httpx) are imported
+# lazily on first use so the UI can render before they are loaded
 import json
 from dotenv import load_dotenv
 
@@ -26,6 +23,10 @@ from quick_actions import (
     request_wifi_access
 )
 
+# Import retrieved-context compression and the prebuilt startup artifact
+from context_compression import build_compressed_retriever, estimate_tokens
+from startup_artifact import create_embeddings, load_artifact
+
 # Load environment variables
 load_dotenv()
 
@@ -85,6 +86,8 @@ if 'retrieval_chain' not in st.session_state:
     st.session_state.retrieval_chain = None
 if 'chat_model' not in st.session_state:
     st.session_state.chat_model = None
+if 'token_savings' not in st.session_state:
+    st.session_state.token_savings = []
 
 # Functions from the original chatbot
 def check_system_status(device_id: str) -> str:
@@ -110,6 +113,7 @@ def check_system_status(device_id: str) -> str:
 
 def load_knowledge_base_from_csv(csv_file="helpdesk_knowledge_base.csv"):
     """Load IT helpdesk knowledge base from CSV file"""
+    import pandas as pd
     try:
         csv_path = os.path.join(current_dir, csv_file)
         df = pd.read_csv(csv_path)
@@ -122,7 +126,8 @@ def load_knowledge_base_from_csv(csv_file="helpdesk_knowledge_base.csv"):
         return documents, df
         
     except Exception as e:
-        st.error(f"Error loading CSV: {e}")
+        # Runs in the warm-up thread, so report to the server log rather than the page
+        print(f"Error loading CSV: {e}")
         # Fallback documents
         fallback_docs = [
             "How to reset my password? Visit the password reset page and follow the instructions.",
@@ -142,33 +147,48 @@ def load_knowledge_base_from_csv(csv_file="helpdesk_knowledge_base.csv"):
 
 # Quick Actions Functions are imported from quick_actions.py
 
-@st.cache_resource
+def import_heavy_modules():
+    """Import the heavy chatbot dependencies and tokenizer, returning the time taken in seconds"""
+    start = time.perf_counter()
+    import pandas  # noqa: F401
+    import httpx  # noqa: F401
+    import openai  # noqa: F401
+    import langchain.chains  # noqa: F401
+    import langchain_community.vectorstores  # noqa: F401
+    import langchain_openai  # noqa: F401
+    # Load the tokenizer now so the first user turn does not pay for it
+    estimate_tokens("warmup")
+    return time.perf_counter() - start
+
 def initialize_chatbot():
     """Initialize the chatbot components"""
     try:
-        # Load environment variables
-        ssl_verify = os.getenv("SSL_VERIFY", "false").lower() == "true"
-        http_client = httpx.Client(verify=ssl_verify)
+        import pandas as pd
+        from langchain_community.vectorstores import FAISS
+        from langchain_openai import AzureChatOpenAI
+        from langchain.chains import ConversationalRetrievalChain
         
+        # Load environment variables
         AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
         AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
-        AZURE_EMBEDDINGS_ENDPOINT = os.getenv("AZURE_EMBEDDINGS_ENDPOINT")
-        AZURE_EMBEDDINGS_API_KEY = os.getenv("AZURE_EMBEDDINGS_API_KEY")
-        
-        # Load knowledge base
-        documents, knowledge_df = load_knowledge_base_from_csv()
         
         # Initialize embeddings
-        embeddings = AzureOpenAIEmbeddings(
-            model="text-embedding-3-small",
-            api_version="2024-02-01",
-            azure_endpoint=AZURE_EMBEDDINGS_ENDPOINT,
-            api_key=AZURE_EMBEDDINGS_API_KEY,
-            http_client=http_client
-        )
+        embeddings = create_embeddings()
+        
+        # Load knowledge base and its vectors, from the prebuilt artifact when available
+        artifact = load_artifact()
+        if artifact:
+            documents = artifact['documents']
+            vectors = artifact['vectors']
+            knowledge_df = pd.DataFrame(artifact['records'])
+        else:
+            documents, knowledge_df = load_knowledge_base_from_csv()
+            vectors = embeddings.embed_documents(documents)
         
-        # Create vector store
-        vector_store = FAISS.from_texts(documents, embedding=embeddings)
+        # Create vector store, keeping the document vectors for deduplication
+        vector_store = FAISS.from_embeddings(list(zip(documents, vectors)), embedding=embeddings)
+        text_vectors = dict(zip(documents, vectors))
+        retriever = build_compressed_retriever(vector_store, text_vectors)
         
         # Initialize chat model
         chat_model = AzureChatOpenAI(
@@ -181,7 +201,7 @@ def initialize_chatbot():
         # Setup retrieval chain
         retrieval_chain = ConversationalRetrievalChain.from_llm(
             llm=chat_model,
-            retriever=vector_store.as_retriever(),
+            retriever=retriever,
             return_source_documents=True
         )
         
@@ -192,15 +212,70 @@ def initialize_chatbot():
             'knowledge_df': knowledge_df,
             'documents_count': len(documents),
             'categories': knowledge_df['category'].unique().tolist(),
+            'artifact_used': artifact is not None,
             'initialized': True
         }
         
     except Exception as e:
-        st.error(f"Failed to initialize chatbot: {e}")
+        print(f"Failed to initialize chatbot: {e}")
         return {'initialized': False, 'error': str(e)}
 
+class ChatbotWarmup:
+    """Runs the heavy imports and chatbot initialization in a background thread"""
+    
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.import_seconds = None
+        self.ready_seconds = None
+        self.first_answer_seconds = None
+        self.result = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        try:
+            self.import_seconds = import_heavy_modules()
+            result = initialize_chatbot()
+        except Exception as e:
+            result = {'initialized': False, 'error': str(e)}
+        self.ready_seconds = self.elapsed()
+        self.result = result
+        print(f"⏱️ Chatbot warm-up: imports {self.import_seconds or 0:.2f}s, "
+              f"ready after {self.ready_seconds:.2f}s, "
+              f"startup artifact used: {result.get('artifact_used', False)}")
+    
+    def elapsed(self):
+        """Seconds since warm-up started"""
+        return time.perf_counter() - self.started_at
+    
+    def is_ready(self):
+        """True once initialization has finished, successfully or not"""
+        return self.result is not None
+    
+    def record_answer(self, seconds):
+        """Record how long the first question after warm-up took to answer"""
+        with self._lock:
+            if self.first_answer_seconds is None:
+                self.first_answer_seconds = seconds
+                print(f"⏱️ First answer took {self.first_answer_seconds:.2f}s")
+
+@st.cache_resource
+def start_chatbot_warmup():
+    """Start the background warm-up once per server process"""
+    return ChatbotWarmup()
+
+@st.fragment(run_every=1)
+def show_warmup_status(warmup):
+    """Show warm-up progress, rerunning the app once the chatbot is ready"""
+    if warmup.is_ready():
+        st.rerun()
+    st.info(f"⏳ Warming up chatbot... ({warmup.elapsed():.0f}s)")
+
 def chat_with_functions(user_input, chat_history):
     """Handle function calling for system status checks"""
+    import httpx
+    from openai import AzureOpenAI
     try:
         # Environment variables
         AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
@@ -267,14 +342,19 @@ def main():
     # Header
     st.markdown('<h1 class="main-header">🤖 IT Helpdesk Chatbot</h1>', unsafe_allow_html=True)
     
+    # Start warming up in the background so the page renders immediately
+    warmup = start_chatbot_warmup()
+    
     # Sidebar
     with st.sidebar:
         st.header("📊 System Status")
         
         # Initialize chatbot
         if not st.session_state.embeddings_initialized:
-            with st.spinner("Initializing chatbot..."):
-                chatbot_data = initialize_chatbot()
+            if not warmup.is_ready():
+                show_warmup_status(warmup)
+            else:
+                chatbot_data = warmup.result
                 if chatbot_data['initialized']:
                     st.session_state.vector_store = chatbot_data['vector_store']
                     st.session_state.retrieval_chain = chatbot_data['retrieval_chain']
@@ -287,70 +367,96 @@ def main():
                     st.error("❌ Failed to initialize chatbot")
                     st.text(chatbot_data.get('error', 'Unknown error'))
         
-        # Quick Actions (always visible after initialization)
-        if st.session_state.embeddings_initialized:
-            st.subheader("⚡ Quick Actions")
-            
-            if st.button("🔐 Reset Password", key="reset_pwd", use_container_width=True):
-                result = reset_password()
-                st.balloons()
-                # Create a popup dialog
-                @st.dialog("🔐 Reset Password - Action Completed!")
-                def show_reset_password_dialog():
-                    st.success("Password reset process has been initiated successfully!")
-                    st.markdown(result)
-                    if st.button("Close", key="close_reset"):
-                        st.rerun()
-                show_reset_password_dialog()
-            
-            if st.button("🔑 Request Admin Permission", key="admin_perm", use_container_width=True):
-                result = request_admin_permission()
-                st.balloons()
-                # Create a popup dialog
-                @st.dialog("🔑 Admin Permission - Request Submitted!")
-                def show_admin_permission_dialog():
-                    st.success("Admin permission request has been submitted successfully!")
-                    st.markdown(result)
-                    if st.button("Close", key="close_admin"):
-                        st.rerun()
-                show_admin_permission_dialog()
-            
-            if st.button("🔓 Unblock Account", key="unblock_acc", use_container_width=True):
-                result = unblock_account()
-                st.balloons()
-                # Create a popup dialog
-                @st.dialog("🔓 Unblock Account - Action Completed!")
-                def show_unblock_account_dialog():
-                    st.success("Account unblock process has been completed successfully!")
-                    st.markdown(result)
-                    if st.button("Close", key="close_unblock"):
-                        st.rerun()
-                show_unblock_account_dialog()
-            
-            if st.button("🎫 Submit Ticket", key="submit_ticket", use_container_width=True):
-                result = submit_ticket()
-                st.balloons()
-                # Create a popup dialog
-                @st.dialog("🎫 Support Ticket - Created Successfully!")
-                def show_submit_ticket_dialog():
-                    st.success("IT support ticket has been created successfully!")
-                    st.markdown(result)
-                    if st.button("Close", key="close_ticket"):
-                        st.rerun()
-                show_submit_ticket_dialog()
-            
-            if st.button("📶 Request WiFi Access", key="wifi_access", use_container_width=True):
-                result = request_wifi_access()
-                st.balloons()
-                # Create a popup dialog
-                @st.dialog("📶 WiFi Access - Request Processed!")
-                def show_wifi_access_dialog():
-                    st.success("WiFi access request has been processed successfully!")
-                    st.markdown(result)
-                    if st.button("Close", key="close_wifi"):
-                        st.rerun()
-                show_wifi_access_dialog()
+        # Startup timings, so cold-start regressions are visible
+        if warmup.is_ready():
+            timings = f"⏱️ Startup: imports {warmup.import_seconds or 0:.1f}s · ready {warmup.ready_seconds:.1f}s"
+            if warmup.first_answer_seconds is not None:
+                timings += f" · first answer {warmup.first_answer_seconds:.1f}s"
+            if warmup.result.get('artifact_used'):
+                timings += " · prebuilt artifact"
+            st.caption(timings)
+        
+        # Quick Actions (always visible, they do not need the chatbot to be ready)
+        st.subheader("⚡ Quick Actions")
+        
+        if st.button("🔐 Reset Password", key="reset_pwd", use_container_width=True):
+            result = reset_password()
+            st.balloons()
+            # Create a popup dialog
+            @st.dialog("🔐 Reset Password - Action Completed!")
+            def show_reset_password_dialog():
+                st.success("Password reset process has been initiated successfully!")
+                st.markdown(result)
+                if st.button("Close", key="close_reset"):
+                    st.rerun()
+            show_reset_password_dialog()
         
+        if st.button("🔑 Request Admin Permission", key="admin_perm", use_container_width=True):
+            result = request_admin_permission()
+            st.balloons()
+            # Create a popup dialog
+            @st.dialog("🔑 Admin Permission - Request Submitted!")
+            def show_admin_permission_dialog():
+                st.success("Admin permission request has been submitted successfully!")
+                st.markdown(result)
+                if st.button("Close", key="close_admin"):
+                    st.rerun()
+            show_admin_permission_dialog()
+        
+        if st.button("🔓 Unblock Account", key="unblock_acc", use_container_width=True):
+            result = unblock_account()
+            st.balloons()
+            # Create a popup dialog
+            @st.dialog("🔓 Unblock Account - Action Completed!")
+            def show_unblock_account_dialog():
+                st.success("Account unblock process has been completed successfully!")
+                st.markdown(result)
+                if st.button("Close", key="close_unblock"):
+                    st.rerun()
+            show_unblock_account_dialog()
+        
+        if st.button("🎫 Submit Ticket", key="submit_ticket", use_container_width=True):
+            result = submit_ticket()
+            st.balloons()
+            # Create a popup dialog
+            @st.dialog("🎫 Support Ticket - Created Successfully!")
+            def show_submit_ticket_dialog():
+                st.success("IT support ticket has been created successfully!")
+                st.markdown(result)
+                if st.button("Close", key="close_ticket"):
+                    st.rerun()
+            show_submit_ticket_dialog()
+        
+        if st.button("📶 Request WiFi Access", key="wifi_access", use_container_width=True):
+            result = request_wifi_access()
+            st.balloons()
+            # Create a popup dialog
+            @st.dialog("📶 WiFi Access - Request Processed!")
+            def show_wifi_access_dialog():
+                st.success("WiFi access request has been processed successfully!")
+                st.markdown(result)
+                if st.button("Close", key="close_wifi"):
+                    st.rerun()
+            show_wifi_access_dialog()
+        
+        # Context compression report
+        if st.session_state.token_savings:
+            st.subheader("🧮 Context Compression")
+            last_turn = st.session_state.token_savings[-1]
+            total_saved = sum(stats['saved_tokens'] for stats in st.session_state.token_savings)
+            st.metric(
+                "Prompt tokens (last turn)",
+                last_turn['compressed_tokens'],
+                delta=-last_turn['saved_tokens'],
+                delta_color="inverse"
+            )
+            st.caption(
+                f"Passages kept: {last_turn['passages_out']}/{last_turn['passages_in']} "
+                f"({last_turn['duplicates']} duplicates, {last_turn['below_threshold']} low relevance, "
+                f"{last_turn['over_budget']} over budget)"
+            )
+            st.caption(f"Total tokens saved this session: {total_saved}")
+    
     # Main chat interface
     if st.session_state.embeddings_initialized:
         st.subheader("💬 Chat with IT Support")
@@ -377,6 +483,7 @@ def main():
         user_input = st.chat_input("Type your question here...")
         
         if user_input:
+            request_start = time.perf_counter()
             timestamp = datetime.now().strftime("%H:%M:%S")
             
             with st.spinner("🔍 Searching knowledge base..."):
@@ -388,6 +495,11 @@ def main():
                     })
                     
                     knowledge_answer = rag_result['answer']
+                    source_documents = rag_result.get('source_documents') or []
+                    if source_documents:
+                        st.session_state.token_savings.append(
+                            source_documents[0].metadata['compression_stats']
+                        )
                     
                     # Check for function calling
                     func_answer, is_function_call = chat_with_functions(
@@ -403,6 +515,7 @@ def main():
                     
                     # Add to chat history
                     st.session_state.chat_history.append((user_input, final_answer, timestamp))
+                    warmup.record_answer(time.perf_counter() - request_start)
                     
                     # Rerun to update the display
                     st.rerun()
@@ -413,6 +526,7 @@ def main():
         # Clear chat button
         if st.button("🗑️ Clear Chat History"):
             st.session_state.chat_history = []
+            st.session_state.token_savings = []
             st.rerun()
             
     else:
@@ -0,0 +1,152 @@
+"""
+Startup Artifact Module for IT Helpdesk Chatbot
+
+This module precomputes everything the chatbot needs at startup - the
+knowledge base documents, their embedding vectors and the category list -
+into a single JSON file. Building it at deploy time means a cold-started
+instance only has to load the file and rebuild the FAISS index locally
+instead of re-embedding the whole knowledge base through Azure OpenAI.
+
+Build the artifact (this is run from buildCommand in render.yml):
+python startup_artifact.py
+
+Author: IT Helpdesk Chatbot System
+Date: October 19, 2026
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+ARTIFACT_FILE = "startup_artifact.json"
+ARTIFACT_VERSION = 1
+KNOWLEDGE_BASE_FILE = "helpdesk_knowledge_base.csv"
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+def create_embeddings():
+    """
+    Create the Azure OpenAI embeddings client from environment variables
+
+    Returns:
+        AzureOpenAIEmbeddings: Embeddings client used for documents and queries
+    """
+    import httpx
+    from langchain_openai import AzureOpenAIEmbeddings
+
+    ssl_verify = os.getenv("SSL_VERIFY", "false").lower() == "true"
+    return AzureOpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        api_version="2024-02-01",
+        azure_endpoint=os.getenv("AZURE_EMBEDDINGS_ENDPOINT"),
+        api_key=os.getenv("AZURE_EMBEDDINGS_API_KEY"),
+        http_client=httpx.Client(verify=ssl_verify)
+    )
+
+def file_sha256(path):
+    """
+    Hash a file so a stale artifact can be detected
+
+    Args:
+        path (str): File to hash
+
+    Returns:
+        str: Hex SHA-256 digest of the file contents
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def build_artifact(csv_path=None, artifact_path=None):
+    """
+    Embed the knowledge base and write the startup artifact
+
+    Args:
+        csv_path (str): Knowledge base CSV, defaults to KNOWLEDGE_BASE_FILE
+        artifact_path (str): Output file, defaults to ARTIFACT_FILE
+
+    Returns:
+        dict: The artifact that was written
+    """
+    import pandas as pd
+
+    csv_path = csv_path or os.path.join(current_dir, KNOWLEDGE_BASE_FILE)
+    artifact_path = artifact_path or os.path.join(current_dir, ARTIFACT_FILE)
+
+    df = pd.read_csv(csv_path)
+    documents = [f"{row['question']} {row['solution']}" for _, row in df.iterrows()]
+    vectors = create_embeddings().embed_documents(documents)
+
+    artifact = {
+        'version': ARTIFACT_VERSION,
+        'embedding_model': EMBEDDING_MODEL,
+        'csv_sha256': file_sha256(csv_path),
+        'documents': documents,
+        'vectors': vectors,
+        'records': df.to_dict(orient="records"),
+        'categories': df['category'].unique().tolist(),
+    }
+
+    # Write to a temporary file first so a failed build never leaves a partial artifact
+    tmp_path = artifact_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(artifact, f)
+        os.replace(tmp_path, artifact_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return artifact
+
+def load_artifact(csv_path=None, artifact_path=None):
+    """
+    Load the startup artifact if it exists and matches the knowledge base
+
+    Args:
+        csv_path (str): Knowledge base CSV, defaults to KNOWLEDGE_BASE_FILE
+        artifact_path (str): Artifact file, defaults to ARTIFACT_FILE
+
+    Returns:
+        dict: The artifact, or None if it is missing, unreadable or stale
+    """
+    csv_path = csv_path or os.path.join(current_dir, KNOWLEDGE_BASE_FILE)
+    artifact_path = artifact_path or os.path.join(current_dir, ARTIFACT_FILE)
+
+    try:
+        with open(artifact_path, encoding="utf-8") as f:
+            artifact = json.load(f)
+        if (artifact.get('version') != ARTIFACT_VERSION
+                or artifact.get('embedding_model') != EMBEDDING_MODEL
+                or artifact.get('csv_sha256') != file_sha256(csv_path)):
+            return None
+        return artifact
+    except (OSError, ValueError):
+        return None
+
+def main(csv_path=None, artifact_path=None):
+    """Build the startup artifact from the command line"""
+    from dotenv import load_dotenv
+    from context_compression import estimate_tokens
+    load_dotenv()
+
+    # Download the tokenizer into the project so startup never has to fetch it
+    estimate_tokens("warmup")
+
+    print("🏗️ Building startup artifact...")
+    start = time.perf_counter()
+    try:
+        artifact = build_artifact(csv_path, artifact_path)
+    except Exception as e:
+        # Never fail the deploy - the app falls back to embedding at startup
+        print(f"⚠️ Could not build startup artifact: {e}")
+        print("   The chatbot will embed the knowledge base at startup instead.")
+        return 0
+
+    print(f"✅ Embedded {len(artifact['documents'])} documents "
+          f"in {time.perf_counter() - start:.1f}s -> {ARTIFACT_FILE}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Test script for Context Compression module
+
+This script tests the post-retrieval compression stage: relevance cutoff,
+near-duplicate removal and token budget packing.
+
+Run this script to verify the Context Compression functionality:
+python test_context_compression.py
+"""
+
+from context_compression import (
+    compress_context,
+    cosine_similarity,
+    estimate_tokens,
+    load_compression_settings,
+    DEFAULT_SETTINGS
+)
+
+PASSWORD_DOC = "How to reset my password? Visit the password reset page and follow the instructions."
+PASSWORD_DUP = "How do I reset my password? Visit the password reset page and follow the steps."
+VPN_DOC = "Connect to VPN by installing the client from the IT portal and logging in."
+PRINTER_DOC = "Printer issues: check paper jam, ensure toner is full, restart printer."
+
+def test_relevance_cutoff():
+    """Test that passages below the relevance threshold are dropped"""
+    print("🧪 Testing Relevance Cutoff")
+    print("=" * 50)
+
+    passages = [
+        (PASSWORD_DOC, 0.9, [1.0, 0.0, 0.0]),
+        (PRINTER_DOC, 0.1, [0.0, 0.0, 1.0]),
+    ]
+    kept, stats = compress_context(passages, {'relevance_threshold': 0.3})
+
+    assert kept == [PASSWORD_DOC]
+    assert stats['below_threshold'] == 1
+    print(f"✅ Kept {stats['passages_out']}/{stats['passages_in']} passages")
+    print()
+
+def test_top_passage_always_kept():
+    """Test that the best passage survives the cutoff and the token budget"""
+    print("🧪 Testing Top Passage Is Always Kept")
+    print("=" * 50)
+
+    passages = [
+        (VPN_DOC, -0.2, [0.0, 1.0, 0.0]),
+        (PASSWORD_DOC, -0.1, [1.0, 0.0, 0.0]),
+        (PRINTER_DOC, -0.4, [0.0, 0.0, 1.0]),
+    ]
+    kept, stats = compress_context(passages, {'relevance_threshold': 0.3})
+
+    assert kept == [PASSWORD_DOC]
+    assert stats['below_threshold'] == 2
+    print("✅ All passages below cutoff: top passage kept")
+
+    kept, stats = compress_context([(PASSWORD_DOC, 0.9, None)], {'token_budget': 1})
+
+    assert kept == [PASSWORD_DOC]
+    assert stats['over_budget'] == 0
+    print("✅ Top passage over budget: still kept")
+
+    kept, stats = compress_context([])
+
+    assert kept == []
+    assert stats['saved_tokens'] == 0
+    print("✅ No passages: nothing kept")
+    print()
+
+def test_duplicate_removal():
+    """Test that near-identical passages are deduplicated"""
+    print("🧪 Testing Duplicate Removal")
+    print("=" * 50)
+
+    passages = [
+        (PASSWORD_DOC, 0.9, [1.0, 0.0, 0.0]),
+        (PASSWORD_DUP, 0.88, [0.99, 0.05, 0.0]),
+        (PASSWORD_DOC, 0.85, None),
+        (VPN_DOC, 0.6, [0.0, 1.0, 0.0]),
+    ]
+    kept, stats = compress_context(passages)
+
+    assert kept == [PASSWORD_DOC, VPN_DOC]
+    assert stats['duplicates'] == 2
+    assert stats['saved_tokens'] == estimate_tokens(PASSWORD_DUP) + estimate_tokens(PASSWORD_DOC)
+    print(f"✅ Removed {stats['duplicates']} duplicates, saved {stats['saved_tokens']} tokens")
+    print()
+
+def test_token_budget():
+    """Test that kept passages fit into the token budget"""
+    print("🧪 Testing Token Budget Packing")
+    print("=" * 50)
+
+    passages = [
+        (PASSWORD_DOC, 0.9, [1.0, 0.0, 0.0]),
+        (VPN_DOC, 0.8, [0.0, 1.0, 0.0]),
+        (PRINTER_DOC, 0.7, [0.0, 0.0, 1.0]),
+    ]
+    budget = estimate_tokens(PASSWORD_DOC) + estimate_tokens(VPN_DOC)
+    kept, stats = compress_context(passages, {'token_budget': budget})
+
+    assert kept == [PASSWORD_DOC, VPN_DOC]
+    assert stats['over_budget'] == 1
+    assert stats['compressed_tokens'] <= budget
+    print(f"✅ Packed {stats['compressed_tokens']} tokens into a budget of {budget}")
+    print()
+
+def test_utility_functions():
+    """Test helper functions in the module"""
+    print("🔧 Testing Utility Functions")
+    print("=" * 50)
+
+    assert cosine_similarity([1.0, 0.0], [1.0, 0.0]) == 1.0
+    assert cosine_similarity([1.0, 0.0], [0.0, 1.0]) == 0.0
+    assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+    assert estimate_tokens("") == 0
+    assert estimate_tokens(PASSWORD_DOC) > 0
+    print("✅ cosine_similarity() and estimate_tokens(): SUCCESS")
+
+    settings = load_compression_settings()
+    assert set(settings) == set(DEFAULT_SETTINGS)
+    print(f"✅ load_compression_settings(): {settings}")
+    print()
+
+def main():
+    """Run all tests"""
+    print("🚀 Context Compression Module Test Suite")
+    print("=" * 50)
+    print()
+
+    test_relevance_cutoff()
+    test_top_passage_always_kept()
+    test_duplicate_removal()
+    test_token_budget()
+    test_utility_functions()
+
+    print("🎉 Test Suite Complete!")
+
+if __name__ == "__main__":
+    main()
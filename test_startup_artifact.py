@@ -0,0 +1,172 @@
+"""
+Test script for Startup Artifact module
+
+This script tests that the startup artifact is built atomically and only
+loaded when it matches the current knowledge base, so a stale or partial
+build is never served.
+
+Run this script to verify the Startup Artifact functionality:
+python test_startup_artifact.py
+"""
+
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+import startup_artifact
+from startup_artifact import (
+    build_artifact,
+    load_artifact,
+    file_sha256,
+    ARTIFACT_VERSION,
+    EMBEDDING_MODEL
+)
+
+class FakeEmbeddings:
+    """Stands in for AzureOpenAIEmbeddings, returning fixed vectors"""
+
+    def __init__(self, vector=None):
+        self.vector = vector if vector is not None else [0.1, 0.2, 0.3]
+
+    def embed_documents(self, documents):
+        return [self.vector for _ in documents]
+
+def use_fake_embeddings(fake):
+    """Replace create_embeddings with a fake, returning the original to restore"""
+    original = startup_artifact.create_embeddings
+    startup_artifact.create_embeddings = lambda: fake
+    return original
+
+def write_fixture(directory, **overrides):
+    """Write a knowledge base CSV and a matching artifact, returning both paths"""
+    csv_path = os.path.join(directory, "kb.csv")
+    artifact_path = os.path.join(directory, "artifact.json")
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write("category,question,solution\nPassword,How to reset my password?,Visit the reset page.\n")
+
+    artifact = {
+        'version': ARTIFACT_VERSION,
+        'embedding_model': EMBEDDING_MODEL,
+        'csv_sha256': file_sha256(csv_path),
+        'documents': ["How to reset my password? Visit the reset page."],
+        'vectors': [[0.1, 0.2, 0.3]],
+        'records': [{'category': 'Password', 'question': 'How to reset my password?',
+                     'solution': 'Visit the reset page.'}],
+        'categories': ['Password'],
+    }
+    artifact.update(overrides)
+    with open(artifact_path, "w", encoding="utf-8") as f:
+        json.dump(artifact, f)
+    return csv_path, artifact_path
+
+def test_load_matching_artifact():
+    """Test that an up-to-date artifact is loaded"""
+    print("🧪 Testing Matching Artifact")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, artifact_path = write_fixture(directory)
+        artifact = load_artifact(csv_path, artifact_path)
+
+    assert artifact is not None
+    assert artifact['categories'] == ['Password']
+    print(f"✅ Loaded artifact with {len(artifact['documents'])} documents")
+    print()
+
+def test_reject_stale_artifact():
+    """Test that missing, stale or mismatched artifacts are ignored"""
+    print("🧪 Testing Stale Artifact Detection")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, artifact_path = write_fixture(directory)
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("Network,Connect to VPN,Install the VPN client.\n")
+        assert load_artifact(csv_path, artifact_path) is None
+        print("✅ Knowledge base changed: artifact ignored")
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, artifact_path = write_fixture(directory, embedding_model="other-model")
+        assert load_artifact(csv_path, artifact_path) is None
+        print("✅ Embedding model changed: artifact ignored")
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, artifact_path = write_fixture(directory)
+        os.remove(artifact_path)
+        assert load_artifact(csv_path, artifact_path) is None
+        print("✅ Missing artifact: returned None")
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, artifact_path = write_fixture(directory)
+        with open(artifact_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        assert load_artifact(csv_path, artifact_path) is None
+        print("✅ Corrupt artifact: returned None")
+    print()
+
+def test_build_artifact():
+    """Test that build_artifact writes a loadable artifact atomically"""
+    print("🏗️ Testing Artifact Build")
+    print("=" * 50)
+
+    original = use_fake_embeddings(FakeEmbeddings())
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path, artifact_path = write_fixture(directory)
+            os.remove(artifact_path)
+            build_artifact(csv_path, artifact_path)
+
+            assert not os.path.exists(artifact_path + ".tmp")
+            artifact = load_artifact(csv_path, artifact_path)
+            assert artifact is not None
+            assert artifact['vectors'] == [[0.1, 0.2, 0.3]]
+            print("✅ Artifact written and loadable, no temporary file left")
+
+            # Records round-trip into the DataFrame initialize_chatbot builds
+            knowledge_df = pd.DataFrame(artifact['records'])
+            pd.testing.assert_frame_equal(knowledge_df, pd.read_csv(csv_path))
+            assert artifact['categories'] == knowledge_df['category'].unique().tolist()
+            print("✅ records and categories round-trip through pd.DataFrame")
+    finally:
+        startup_artifact.create_embeddings = original
+    print()
+
+def test_failed_build():
+    """Test that a failed build keeps the old artifact and never fails the deploy"""
+    print("🧪 Testing Failed Artifact Build")
+    print("=" * 50)
+
+    # A vector that cannot be serialized makes json.dump fail part-way through
+    original = use_fake_embeddings(FakeEmbeddings(vector=[object()]))
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path, artifact_path = write_fixture(directory)
+            with open(artifact_path, encoding="utf-8") as f:
+                previous = f.read()
+
+            assert startup_artifact.main(csv_path, artifact_path) == 0
+            assert not os.path.exists(artifact_path + ".tmp")
+            with open(artifact_path, encoding="utf-8") as f:
+                assert f.read() == previous
+            print("✅ main() returned 0, previous artifact kept, no temporary file left")
+    finally:
+        startup_artifact.create_embeddings = original
+    print()
+
+def main():
+    """Run all tests"""
+    print("🚀 Startup Artifact Module Test Suite")
+    print("=" * 50)
+    print()
+
+    test_load_matching_artifact()
+    test_reject_stale_artifact()
+    test_build_artifact()
+    test_failed_build()
+
+    print("🎉 Test Suite Complete!")
+
+if __name__ == "__main__":
+    main()